@@ -9,6 +9,11 @@ setup(
         'djangorestframework>=3.14.0',  # Added Django REST framework with version
         'django>=4.2.0',  # Added Django as it's required for DRF
     ],
+    extras_require={
+        'async': ['aiohttp>=3.8'],
+        'speedups': ['orjson>=3.6', 'pybase64>=1.0'],
+        'stream': ['ijson>=3.1'],
+    },
     author="Derrick Mugisha",
     author_email="derrimugisha@gmail.com",
     description="A utility package that provides RESTful integration between Odoo and Django frameworks, enabling seamless communication and data synchronization between both platforms.",
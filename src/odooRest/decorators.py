@@ -1,18 +1,39 @@
 import functools
+import hashlib
 import json
-import base64
-import traceback  # For detailed error messages
+import logging
+import binascii
 from datetime import datetime, date
+from http.cookies import SimpleCookie
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+_logger = logging.getLogger(__name__)
 
 try:
     from rest_framework.response import Response
-    from django.http import JsonResponse
+    from django.http import HttpResponse, StreamingHttpResponse
     DJANGO_ENVIRONMENT = True
 except ImportError:
     DJANGO_ENVIRONMENT = False
 
 if DJANGO_ENVIRONMENT:
-    from .odoo_utils import odoo_request, authenticate, call_odoo
+    from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
+    from .odoo_utils import authenticate, call_odoo, TTLCache
+
+    # Encodes what DRF's renderer accepts beyond plain JSON (Decimal, timedelta, UUID, lazy strings)
+    _DRF_ENCODER = DRFJSONEncoder()
+
+    # Serialized search_read/read results of endpoints decorated with cache_ttl
+    _RESULT_CACHE = TTLCache(maxsize=4096)
 
     class UserError(Exception):
         pass
@@ -22,11 +43,14 @@ if DJANGO_ENVIRONMENT:
 
     class AccessError(Exception):
         pass
+
+    class MissingError(Exception):
+        pass
 else:
     try:
         from odoo import http
         from odoo.http import request
-        from odoo.exceptions import UserError, ValidationError, AccessError
+        from odoo.exceptions import UserError, ValidationError, AccessError, MissingError
         from odoo import models
     except ImportError:
         class UserError(Exception):
@@ -38,6 +62,87 @@ else:
         class AccessError(Exception):
             pass
 
+        class MissingError(Exception):
+            pass
+
+
+def _default(value):
+    """Fallback for values neither orjson nor json encode natively"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray)):
+        return _b64encode(value)
+    if hasattr(value, '_name'):  # Odoo records
+        records = [{
+            'id': r.id,
+            'name': r.name if hasattr(r, 'name') else str(r.id),
+            'model': r._name
+        } for r in value]
+        if not records:
+            return False
+        return records[0] if len(records) == 1 else records
+    if DJANGO_ENVIRONMENT:
+        # Responses used to be rendered by DRF; keep accepting what its encoder did
+        return _DRF_ENCODER.default(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(data):
+    # Serialize straight to bytes so the response body needs no extra encode pass.
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_default).encode('utf-8')
+
+
+def _fingerprint(data):
+    """Canonical (key-sorted) serialization of ``data``, used for cache keys"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+
+
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Record lists longer than this are streamed instead of serialized in one piece
+STREAM_THRESHOLD = 500
+_STREAM_CHUNK_SIZE = 100
+
+
+def _iter_json_array(records):
+    """Yield ``records`` as a JSON array, one chunk of records at a time"""
+    yield b'['
+    for start in range(0, len(records), _STREAM_CHUNK_SIZE):
+        if start:
+            yield b','
+        # Strip the brackets of each chunk's own array
+        yield _dumps(records[start:start + _STREAM_CHUNK_SIZE])[1:-1]
+    yield b']'
+
+
+def _should_stream(result):
+    return isinstance(result, list) and len(result) > STREAM_THRESHOLD
+
+
+def _etag(body):
+    """Weak validator for a serialized response body"""
+    return 'W/"%s"' % hashlib.blake2b(body, digest_size=12).hexdigest()
+
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    # Weak comparison: W/"x" and "x" are the same validator
+    tags = {_strip_weak(tag.strip()) for tag in if_none_match.split(',')}
+    return '*' in tags or _strip_weak(etag) in tags
+
+
+def _strip_weak(tag):
+    return tag[2:] if tag.startswith('W/') else tag
+
 
 class UniversalConnector:
     @staticmethod
@@ -45,19 +150,53 @@ class UniversalConnector:
         return DJANGO_ENVIRONMENT
 
     @staticmethod
-    def get_response(data, status=200):
+    def get_response(data, status=200, etag=None, max_age=0):
+        if DJANGO_ENVIRONMENT:
+            response = Response(data, status=status)
+        else:
+            response = http.Response(_dumps(data), status=status, content_type='application/json')
+        if etag is not None:
+            UniversalConnector.set_cache_headers(response, etag, max_age)
+        return response
+
+    @staticmethod
+    def get_not_modified(etag, max_age=0):
+        if DJANGO_ENVIRONMENT:
+            response = HttpResponse(status=304)
+        else:
+            response = http.Response(status=304)
+        UniversalConnector.set_cache_headers(response, etag, max_age)
+        return response
+
+    @staticmethod
+    def set_cache_headers(response, etag, max_age=0):
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = f'private, max-age={max_age}'
+
+    @staticmethod
+    def get_if_none_match(request):
         if DJANGO_ENVIRONMENT:
-            return Response(data, status=status)
+            return request.META.get('HTTP_IF_NONE_MATCH')
         else:
-            return http.Response(json.dumps(data), status=status, content_type='application/json')
+            return request.httprequest.headers.get('If-None-Match')
+
+    @staticmethod
+    def get_streaming_response(records, status=200):
+        if DJANGO_ENVIRONMENT:
+            return StreamingHttpResponse(
+                _iter_json_array(records), status=status, content_type='application/json')
+        else:
+            return http.Response(
+                _iter_json_array(records), status=status, content_type='application/json',
+                direct_passthrough=True)
 
     @staticmethod
     def get_session(request):
         if DJANGO_ENVIRONMENT:
-            if hasattr(request, 'COOKIES'):
-                return request.COOKIES.get('session_id')
-            elif hasattr(request, '_request'):
-                return request._request.COOKIES.get('session_id')
+            cookies = getattr(request, 'COOKIES', None)
+            if cookies is None:
+                cookies = getattr(getattr(request, '_request', None), 'COOKIES', None)
+            return cookies.get('session_id') if cookies is not None else None
         else:
             return request.session.sid
 
@@ -65,8 +204,21 @@ class UniversalConnector:
     def set_cookie(response, key, value):
         response.set_cookie(key, value)
 
+    @staticmethod
+    def set_cookies(response, cookies):
+        if DJANGO_ENVIRONMENT:
+            # Fill one cookie jar and merge it in, instead of a set_cookie call per cookie
+            jar = SimpleCookie()
+            for key, value in cookies.items():
+                jar[key] = value
+                jar[key]['path'] = '/'
+            response.cookies.update(jar)
+        else:
+            for key, value in cookies.items():
+                response.set_cookie(key, value)
+
 
-def odoo_auth(odoo_url, odoo_db):
+def odoo_auth(odoo_url, odoo_db, cache_ttl=None):
     def decorator(func):
         if DJANGO_ENVIRONMENT:
             @functools.wraps(func)
@@ -82,7 +234,7 @@ def odoo_auth(odoo_url, odoo_db):
                         )
 
                     auth_result = authenticate(
-                        odoo_url, odoo_db, username, password)
+                        odoo_url, odoo_db, username, password, cache_ttl=cache_ttl)
 
                     if "error" in auth_result:
                         return UniversalConnector.get_response(
@@ -91,19 +243,17 @@ def odoo_auth(odoo_url, odoo_db):
 
                     request.odoo_session = auth_result
 
-                    response = UniversalConnector.get_response(
-                        {"message": "Authentication successful", "uid": auth_result['uid']}, status=200
+                    # Fixed-shape body: render it here rather than through DRF's negotiation/renderers
+                    response = HttpResponse(
+                        _dumps({"message": "Authentication successful", "uid": auth_result['uid']}),
+                        content_type='application/json', status=200
                     )
-                    UniversalConnector.set_cookie(
-                        response, 'session_id', auth_result['session_id'])
-
-                    for key, value in auth_result.get('cookies', {}).items():
-                        if key != 'session_id':
-                            UniversalConnector.set_cookie(response, key, value)
+                    UniversalConnector.set_cookies(
+                        response, {**auth_result.get('cookies', {}), 'session_id': auth_result['session_id']})
 
                     return response
                 except Exception as e:
-                    print(traceback.format_exc())
+                    _logger.exception("odoo_auth failed")
                     return UniversalConnector.get_response(
                         {"error": str(e)}, status=500
                     )
@@ -113,21 +263,161 @@ def odoo_auth(odoo_url, odoo_db):
                 try:
                     return func(self, *args, **kwargs)
                 except Exception as e:
-                    print(traceback.format_exc())
+                    _logger.exception("odoo_auth failed")
                     return http.Response(
-                        json.dumps({"error": str(e)}), content_type='application/json', status=500
+                        _dumps({"error": str(e)}), content_type='application/json', status=500
                     )
         return wrapper
     return decorator
 
 
-def odoo_method(model, method, as_http_response=True):
+def _odoo_search_read(env, params):
+    return env.search_read(
+        domain=params.get('domain', []),
+        fields=params.get('fields', []),
+        offset=params.get('offset', 0),
+        limit=params.get('limit', None),
+        order=params.get('order', None),
+    )
+
+
+def _browse_ids(env, params):
+    records = env.browse(params.get('ids', []))
+    if not records:
+        raise ValidationError(f"No records found with ids {params.get('ids')}")
+    return records
+
+
+def _odoo_read(env, params):
+    # read() silently drops missing ids, so an empty result replaces the exists() query
+    result = _browse_ids(env, params).read(params.get('fields', []))
+    if not result:
+        raise ValidationError(f"No records found with ids {params.get('ids')}")
+    return result
+
+
+def _odoo_write(env, params):
+    _logger.debug("Write method called for model %s with params %s", env._name, params)
+
+    # Get the records to update
+    records = _browse_ids(env, params)
+
+    # Perform the write operation; write() raises MissingError for deleted ids
+    try:
+        result = records.write(params.get('values', {}))
+    except MissingError:
+        raise ValidationError(f"No records found with ids {params.get('ids')}")
+    _logger.debug("Write operation completed. Result: %s", result)
+
+    # Read back the updated record for verification, only when it will be logged
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug("Updated record values: %s", records.read(list(params.get('values', {}))))
+    return result
+
+
+def _odoo_unlink(env, params):
+    records = env.browse(params.get('ids', []))
+    if not records.exists():
+        raise ValidationError(f"No records found with ids {params.get('ids')}")
+    return records.unlink()
+
+
+def _odoo_create(env, params):
+    record_data = env.create(params)
+    # One batched ORM read of the written fields; read() rejects unknown names
+    fields_to_read = [field for field in params if field in record_data._fields]
+    return record_data.read(fields_to_read)[0]
+
+
+def _odoo_method_call(method):
+    def operation(env, params):
+        return getattr(env, method)(**params)
+    return operation
+
+
+def _rpc_search_read_params(additional_params):
+    return {
+        'args': [additional_params.get('domain', [])],
+        'kwargs': {
+            'fields': additional_params.get('fields', []),
+            'limit': additional_params.get('limit'),
+        },
+    }
+
+
+def _rpc_read_params(additional_params):
+    return {
+        'args': [additional_params.get('ids', [])],
+        'kwargs': {'fields': additional_params.get('fields', [])},
+    }
+
+
+def _rpc_write_params(additional_params):
+    return {
+        'args': [additional_params.get('ids', []), additional_params.get('values', {})],
+        'kwargs': {},
+    }
+
+
+def _rpc_unlink_params(additional_params):
+    return {
+        'args': [additional_params.get('ids', [])],
+        'kwargs': {},
+    }
+
+
+def _rpc_create_params(additional_params):
+    return {
+        'args': [additional_params],
+        'kwargs': {},
+    }
+
+
+def _rpc_passthrough_params(additional_params):
+    return additional_params
+
+
+# Django-side call_kw argument builder of each CRUD method, picked once at decoration time
+_RPC_PARAM_BUILDERS = {
+    'search_read': _rpc_search_read_params,
+    'read': _rpc_read_params,
+    'write': _rpc_write_params,
+    'unlink': _rpc_unlink_params,
+    'create': _rpc_create_params,
+}
+
+
+# Methods that only read data: eligible for the result cache and for ETag validation
+_CACHEABLE_METHODS = frozenset(('search_read', 'read'))
+
+# Odoo-side implementation of each CRUD method, picked once at decoration time
+_ODOO_OPERATIONS = {
+    'search_read': _odoo_search_read,
+    'read': _odoo_read,
+    'write': _odoo_write,
+    'unlink': _odoo_unlink,
+    'create': _odoo_create,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def odoo_method(model, method, as_http_response=True, cache_ttl=0, max_age=0):
+    conditional = method in _CACHEABLE_METHODS
+
     def decorator(func):
         if DJANGO_ENVIRONMENT:
+            use_cache = cache_ttl > 0 and conditional
+            build_params = _RPC_PARAM_BUILDERS.get(method, _rpc_passthrough_params)
+
             @functools.wraps(func)
             def wrapper(self, request, *args, **kwargs):
                 try:
-                    odoo_session = UniversalConnector.get_session(request)
+                    # Reuse the session odoo_auth attached earlier in this request, if any
+                    auth_result = getattr(request, 'odoo_session', None)
+                    if auth_result:
+                        odoo_session = auth_result['session_id']
+                    else:
+                        odoo_session = UniversalConnector.get_session(request)
                     if not odoo_session:
                         if as_http_response:
                             return UniversalConnector.get_response(
@@ -145,34 +435,23 @@ def odoo_method(model, method, as_http_response=True):
                     after_execution = additional_params.pop('after_execution', None)
 
                     # Structure parameters based on the method
-                    if method == 'search_read':
-                        params = {
-                            'args': [additional_params.get('domain', [])],
-                            'kwargs': {
-                                'fields': additional_params.get('fields', []),
-                                'limit': additional_params.get('limit'),
-                            },
-                        }
-                    elif method == 'read':
-                        params = {
-                            'args': [additional_params.get('ids', [])],
-                            'kwargs': {'fields': additional_params.get('fields', [])},
-                        }
-                    elif method == 'write':
-                        params = {
-                            'args': [additional_params.get('ids', []), additional_params.get('values', {})],
-                            'kwargs': {},
-                        }
-                    elif method == 'unlink':
-                        params = {
-                            'args': [additional_params.get('ids', [])],
-                            'kwargs': {},
-                        }
+                    params = build_params(additional_params)
+
+                    if use_cache:
+                        cache_key = (odoo_session, base_url, model, method, _fingerprint(params))
+                        cached = _RESULT_CACHE.get(cache_key)
                     else:
-                        params = additional_params
+                        cached = None
 
-                    # Call Odoo's RPC method
-                    result = call_odoo(odoo_session, base_url, model, method, params)
+                    if cached is not None:
+                        # Cached as bytes so callbacks can never mutate the cached copy
+                        result = _loads(cached)
+                    else:
+                        # Call Odoo's RPC method
+                        result = call_odoo(odoo_session, base_url, model, method, params)
+                        # call_odoo reports failures as {"error": ...}; only cache record lists
+                        if use_cache and isinstance(result, list):
+                            _RESULT_CACHE.set(cache_key, _dumps(result), cache_ttl)
 
                     if callable(after_execution):
                         result = after_execution(result, params)
@@ -181,6 +460,17 @@ def odoo_method(model, method, as_http_response=True):
                         return custom_response(result, params)
 
                     if as_http_response:
+                        if _should_stream(result):
+                            return UniversalConnector.get_streaming_response(result)
+                        if conditional:
+                            # Serialize once: the same bytes give the ETag and the body
+                            body = _dumps(result)
+                            etag = _etag(body)
+                            if _etag_matches(UniversalConnector.get_if_none_match(request), etag):
+                                return UniversalConnector.get_not_modified(etag, max_age)
+                            response = HttpResponse(body, content_type='application/json')
+                            UniversalConnector.set_cache_headers(response, etag, max_age)
+                            return response
                         return UniversalConnector.get_response(result)
                     else:
                         return result
@@ -197,81 +487,49 @@ def odoo_method(model, method, as_http_response=True):
                         raise
 
         else:
+            operation = _ODOO_OPERATIONS.get(method) or _odoo_method_call(method)
+
             @functools.wraps(func)
             def wrapper(self, *args, **kwargs):
                 try:
                     additional_params = func(self, *args, **kwargs)
-                    params = {**additional_params, **kwargs}
+                    # Route kwargs are usually empty; only copy when there is something to merge
+                    params = {**additional_params, **kwargs} if kwargs else additional_params
 
                     env = request.env[model].sudo()
 
-                    if method == 'search_read':
-                        result = env.search_read(
-                            domain=params.get('domain', []),
-                            fields=params.get('fields', []),
-                            offset=params.get('offset', 0),
-                            limit=params.get('limit', None),
-                            order=params.get('order', None),
-                        )
-                    elif method == 'read':
-                        records = env.browse(params.get('ids', []))
-                        if not records.exists():
-                            raise ValidationError(f"No records found with ids {params.get('ids')}")
-                        result = records.read(params.get('fields', []))
-                    # elif method == 'write':
-                    #     print("++++ ")
-                    #     print(model)
-                    #     print("++++ ")
-                    #     records = env.browse(params.get('ids', []))
-                    #     if not records.exists():
-                    #         raise ValidationError(f"No records found with ids {params.get('ids')}")
-                    #     result = records.write(params.get('values', {}))
-                    elif method == 'write':
-                        print(f"Write method called for model: {model}")
-                        print(f"Params received from decorated function: {params}")
-
-                        # Get the records to update
-                        records = env.browse(params.get('ids', []))
-                        if not records.exists():
-                            raise ValidationError(f"No records found with ids {params.get('ids')}")
-
-                        # Perform the write operation
-                        result = records.write(params.get('values', {}))
-                        print(f"Write operation completed. Result: {result}")
-
-                        # Commit transaction to ensure persistence
-                        request.env.cr.commit()
-                        print(f"Database transaction committed for {params.get('ids')}")
+                    result = operation(env, params)
 
-                        # Optionally, read back the updated record for verification
-                        updated_values = records.read(params['values'].keys())
-                        print(f"Updated record values: {updated_values}")
-                        return result
-                    elif method == 'unlink':
-                        records = env.browse(params.get('ids', []))
-                        if not records.exists():
-                            raise ValidationError(f"No records found with ids {params.get('ids')}")
-                        result = records.unlink()
-                    elif method == 'create':
-                        record_data = env.create(params)
-                        fields_to_read = list(params.keys())
-                        result = record_data.read(fields_to_read)[0]
-                    else:
-                        result = getattr(env, method)(**params)
+                    # Odoo commits when the request ends; only commit mid-request when the
+                    # view itself asks to. Route kwargs come from the client's query string
+                    # and form data, so they must not be able to trigger it.
+                    if method == 'write' and additional_params.get('commit'):
+                        request.env.cr.commit()
+                        _logger.debug("Database transaction committed for %s", params.get('ids'))
 
                     if as_http_response:
-                        return http.Response(json.dumps(result), content_type='application/json')
+                        if _should_stream(result):
+                            return UniversalConnector.get_streaming_response(result)
+                        body = _dumps(result)
+                        if not conditional:
+                            return http.Response(body, content_type='application/json')
+                        etag = _etag(body)
+                        if _etag_matches(UniversalConnector.get_if_none_match(request), etag):
+                            return UniversalConnector.get_not_modified(etag, max_age)
+                        response = http.Response(body, content_type='application/json')
+                        UniversalConnector.set_cache_headers(response, etag, max_age)
+                        return response
                     else:
                         return result
 
                 except (UserError, ValidationError, AccessError) as e:
                     if as_http_response:
-                        return http.Response(json.dumps({"error": str(e)}), content_type='application/json', status=400)
+                        return http.Response(_dumps({"error": str(e)}), content_type='application/json', status=400)
                     else:
                         raise
                 except Exception as e:
                     if as_http_response:
-                        return http.Response(json.dumps({"error": str(e)}), content_type='application/json', status=500)
+                        return http.Response(_dumps({"error": str(e)}), content_type='application/json', status=500)
                     else:
                         raise
 
@@ -279,25 +537,51 @@ def odoo_method(model, method, as_http_response=True):
     return decorator
 
 
+def _b64encode(data):
+    if pybase64 is not None:
+        # SIMD (AVX2/AVX-512/NEON) encoder, picked by pybase64 at import
+        return pybase64.b64encode_as_string(data)
+    # b2a_base64 is the C routine behind base64.b64encode, minus the
+    # wrapper and the utf-8 decode of a known-ascii result.
+    return binascii.b2a_base64(data, newline=False).decode('ascii')
+
+
+@functools.lru_cache(maxsize=512)
+def _image_fields(fields):
+    """Image fields among ``fields``, computed once per distinct field list"""
+    return tuple(field for field in fields if 'image' in field)
+
+
+def _encode_images_inplace(record, image_fields):
+    """Base64-encode the image fields of one record, in place
+
+    Dates are left as-is: _dumps and DRF's encoder both serialize them.
+    """
+    for field in image_fields:
+        value = record.get(field)
+        if value:
+            record[field] = _b64encode(value)
+
+
 def handle_images_in_result(result, fields):
-    if isinstance(result, dict):
-        result = [result]
+    """Encode a record or list of records in place; always returns a list
 
-    image_fields = [field for field in fields if 'image' in field]
+    Callers that know the shape of their result should use
+    ``_encode_images_inplace`` directly.
+    """
+    image_fields = _image_fields(tuple(fields))
+    if not image_fields:
+        return [result] if isinstance(result, dict) else result
 
-    for record in result:
-        for field in image_fields:
-            if field in record and record[field]:
-                record[field] = base64.b64encode(record[field]).decode('utf-8')
+    if isinstance(result, dict):
+        _encode_images_inplace(result, image_fields)
+        return [result]
 
-    # You might want to add datetime handling here
     for record in result:
-        for key, value in record.items():
-            if isinstance(value, (datetime, date)):
-                record[key] = value.isoformat()
-
+        _encode_images_inplace(record, image_fields)
     return result
 
+
 def _prepare_record_data(record, fields_or_params):
     """Helper function to prepare record data for JSON serialization"""
     if isinstance(fields_or_params, dict):
@@ -315,25 +599,49 @@ def _prepare_record_data(record, fields_or_params):
     return result
 
 
-def _convert_field_value(value):
-    """Helper function to convert field values to JSON serializable format"""
+def _convert_record(value):
+    return {
+        'id': value.id,
+        'name': value.name if hasattr(value, 'name') else str(value.id),
+        'model': value._name
+    }
+
+
+def _convert_recordset(value):
+    return [_convert_record(r) for r in value]
+
+
+def _convert_isoformat(value):
+    return value.isoformat()
+
+
+def _convert_identity(value):
+    return value
+
+
+def _resolve_converter(value):
     if hasattr(value, '_name'):  # many2one fields
-        return {
-            'id': value.id,
-            'name': value.name if hasattr(value, 'name') else str(value.id),
-            'model': value._name
-        }
+        return _convert_record
     elif isinstance(value, models.BaseModel):  # other recordsets
-        return [{
-            'id': r.id,
-            'name': r.name if hasattr(r, 'name') else str(r.id),
-            'model': r._name
-        } for r in value]
+        return _convert_recordset
     elif isinstance(value, (datetime, date)):
-        return value.isoformat()
+        return _convert_isoformat
     elif isinstance(value, (bytes, bytearray)):
-        return base64.b64encode(value).decode('utf-8')
-    return value
+        return _b64encode
+    return _convert_identity
+
+
+# Converter per concrete value type, resolved on first encounter
+_CONVERTERS = {}
+
+
+def _convert_field_value(value):
+    """Helper function to convert field values to JSON serializable format"""
+    value_type = type(value)
+    converter = _CONVERTERS.get(value_type)
+    if converter is None:
+        converter = _CONVERTERS[value_type] = _resolve_converter(value)
+    return converter(value)
 
 
 search_read = functools.partial(odoo_method, method='search_read')
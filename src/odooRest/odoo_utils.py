@@ -1,56 +1,256 @@
 # odoo_api/odoo_utils.py
 
+from collections import OrderedDict
+import contextvars
+from functools import partial
+from http import cookiejar
+import hashlib
+import hmac
+import json
+import os
+import socket
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
+from .reliability import BulkheadFullError, guarded_send
 
-def odoo_request(endpoint, base_url, method='GET', data=None, session_id=None):
-    if session_id:
-        headers = {
-            'Content-Type': 'application/json',
-            'Cookie': f'session_id={session_id}'
-        }
-        url = f"{base_url}/api/{endpoint}"
-
-        if method == 'GET':
-            response = requests.get(url, headers=headers, params=data)
-        elif method == 'POST':
-            response = requests.post(url, headers=headers, json=data)
-        elif method == 'PUT':
-            response = requests.put(url, headers=headers, json=data)
-        elif method == 'DELETE':
-            response = requests.delete(url, headers=headers)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+try:
+    import orjson
+    _loads = orjson.loads
+    # Like the stdlib json it replaces, turn int keys (e.g. analytic_distribution) into strings
+    _dumps = partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
 
-        response.raise_for_status()
-        return response.json()
-    else:
-        headers = {
-            'Content-Type': 'application/json',
-            # 'Cookie': f'session_id={session_id}'
-        }
-        if method == 'GET':
-            response = requests.get(url, headers=headers, params=data)
-        elif method == 'POST':
-            response = requests.post(url, headers=headers, json=data)
-        elif method == 'PUT':
-            response = requests.put(url, headers=headers, json=data)
-        elif method == 'DELETE':
-            response = requests.delete(url, headers=headers)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+    def _dumps(data):
+        return json.dumps(data).encode('utf-8')
 
-        response.raise_for_status()
-        return response.json()
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after being set"""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[0] if entry is not None else None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class _NoCookiesPolicy(cookiejar.DefaultCookiePolicy):
+    # The shared session serves many users; never let one user's Odoo
+    # session cookie be stored and replayed on another user's request.
+    def set_ok(self, cookie, request):
+        return False
+
+
+# Timeout in seconds of any Odoo request that does not pass its own
+DEFAULT_TIMEOUT = 10
+
+# Absolute time.monotonic() deadline for every Odoo call made in the current
+# context, e.g. set once by a middleware from the request's own time budget.
+# An explicit ``deadline=`` argument takes precedence.
+odoo_deadline = contextvars.ContextVar('odoo_deadline', default=None)
+
+
+def _send(base_url, send, url, deadline=None, **kwargs):
+    # Send through the circuit breaker, bounded by the deadline if any. The
+    # deadline is exposed through odoo_deadline for the duration of the call
+    # so _DeadlineRetry stops retrying once it has passed.
+    if deadline is None:
+        deadline = odoo_deadline.get()
+    if deadline is None:
+        return guarded_send(base_url, send, url, timeout=DEFAULT_TIMEOUT, **kwargs)
+
+    if deadline <= time.monotonic():
+        raise requests.Timeout("Deadline exceeded before calling Odoo")
+    token = odoo_deadline.set(deadline)
+    try:
+        return guarded_send(base_url, send, url, deadline=deadline, **kwargs)
+    finally:
+        odoo_deadline.reset(token)
+
+
+class _DeadlineRetry(Retry):
+    # urllib3 gives every attempt the full timeout and sleeps between attempts;
+    # give up instead of retrying when the wait would run past odoo_deadline.
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None):
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        deadline = odoo_deadline.get()
+        if deadline is not None:
+            wait = new_retry.get_backoff_time()
+            if response is not None:
+                wait = max(wait, new_retry.get_retry_after(response) or 0)
+            if time.monotonic() + wait >= deadline:
+                raise MaxRetryError(_pool, url, error or ResponseError("Deadline exceeded"))
+        return new_retry
+
+
+class _OdooSession(requests.Session):
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+
+class UpstreamError(requests.HTTPError):
+    """Odoo (or the proxy in front of it) answered with a 5xx status"""
+
+
+def _handle(response):
+    # 2xx: decoded body; 4xx: error dict with the start of the body; 5xx: UpstreamError
+    if response.status_code >= 500:
+        raise UpstreamError(
+            f"{response.status_code} Server Error for url: {response.url}", response=response)
+    if response.status_code >= 400:
+        return {"error": response.text[:256]}
+    return _loads(response.content)
+
+
+_SESSION = _OdooSession()
+_SESSION.cookies.set_policy(_NoCookiesPolicy())
+# Every Odoo call speaks JSON; advertise every compression urllib3 can decode
+# (gzip/deflate, plus br when brotli is installed) so large record lists
+# come back compressed. Requests only layer the Cookie header on top.
+_SESSION.headers.update(make_headers(keep_alive=True, accept_encoding=True))
+_SESSION.headers['Content-Type'] = 'application/json'
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    # TCP_NODELAY (already urllib3's default) keeps small JSON-RPC bodies from
+    # waiting on Nagle; SO_KEEPALIVE lets idle pooled connections be reused
+    # instead of dropped by middleboxes and reopened on a fresh local port.
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Connect errors are retried for every method, since nothing reached Odoo yet.
+# Read errors and 429/502/503/504 answers only for idempotent methods: urllib3's
+# default allowed_methods excludes POST, so a call_kw create or write is never
+# replayed. 429 honours the server's Retry-After.
+_ADAPTER = _KeepAliveAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    max_retries=_DeadlineRetry(total=3, connect=3, read=2, backoff_factor=0.25,
+                              status_forcelist=(429, 502, 503, 504), raise_on_status=False),
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+
+# Constant envelope of every JSON-RPC request; only "params" varies per call
+_RPC_TEMPLATE = {"jsonrpc": "2.0", "method": "call"}
 
 
-def authenticate(odoo_url, odoo_db, username, password):
+# Session call and request-body keyword for each verb odoo_request supports
+_METHOD_DISPATCH = {
+    'GET': (_SESSION.get, 'params'),
+    'POST': (_SESSION.post, 'data'),
+    'PUT': (_SESSION.put, 'data'),
+    'DELETE': (_SESSION.delete, None),
+}
+
+
+def odoo_request(endpoint, base_url, method='GET', data=None, session_id=None, deadline=None):
+    try:
+        send, body_keyword = _METHOD_DISPATCH[method]
+    except KeyError:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
+    headers = {'Cookie': f'session_id={session_id}'} if session_id else None
+    url = f"{base_url}/api/{endpoint}"
+
+    if body_keyword == 'data' and data is not None:
+        data = _dumps(data)
+    body = {body_keyword: data} if body_keyword else {}
+    return _handle(_send(base_url, send, url, deadline, headers=headers, **body))
+
+
+# Successful logins of authenticate(..., cache_ttl>0), one entry per (url, db, user).
+# Entries hold a keyed digest of the password, never the password itself.
+_AUTH_CACHE = TTLCache(maxsize=1024)
+_AUTH_KEY_SECRET = os.urandom(32)
+
+# Default cache_ttl for authenticate()/odoo_auth(); 0 keeps login caching off
+DEFAULT_AUTH_CACHE_TTL = int(os.environ.get('ODOO_SESSION_TTL', 0))
+
+
+def _password_digest(password):
+    return hmac.new(_AUTH_KEY_SECRET, password.encode('utf-8'), hashlib.sha256).digest()
+
+
+def authenticate(odoo_url, odoo_db, username, password, cache_ttl=None, deadline=None):
+    if cache_ttl is None:
+        cache_ttl = DEFAULT_AUTH_CACHE_TTL
+
+    if cache_ttl > 0:
+        cache_key = (odoo_url, odoo_db, username)
+        password_digest = _password_digest(password)
+        cached = _AUTH_CACHE.get(cache_key)
+        if cached is not None and hmac.compare_digest(cached[0], password_digest):
+            return dict(cached[1])
+
+    result = _authenticate(odoo_url, odoo_db, username, password, deadline)
+
+    if cache_ttl > 0 and "error" not in result:
+        _AUTH_CACHE.set(cache_key, (password_digest, dict(result)), cache_ttl)
+    return result
+
+
+def invalidate_auth(odoo_url, odoo_db, username):
+    """Forget the cached login of ``username``, e.g. after Odoo reported its session expired"""
+    _AUTH_CACHE.pop((odoo_url, odoo_db, username))
+
+
+def _authenticate(odoo_url, odoo_db, username, password, deadline=None):
     url = f"{odoo_url}/web/session/authenticate"
     db = odoo_db
 
     auth_data = {
-        "jsonrpc": "2.0",
-        "method": "call",
+        **_RPC_TEMPLATE,
         "params": {
             "db": db,
             "login": username,
@@ -59,9 +259,8 @@ def authenticate(odoo_url, odoo_db, username, password):
     }
 
     try:
-        response = requests.post(url, json=auth_data, timeout=10)
-        response.raise_for_status()
-        result = response.json()
+        response = _send(odoo_url, _SESSION.post, url, deadline, data=_dumps(auth_data))
+        result = _handle(response)
 
         if result.get("result"):
             session_id = response.cookies.get('session_id')
@@ -78,18 +277,24 @@ def authenticate(odoo_url, odoo_db, username, password):
 
     except requests.RequestException as e:
         return {"error": f"Network error: {str(e)}"}
+    except ValueError as e:
+        return {"error": f"Invalid JSON response: {str(e)}"}
 
 
-def call_odoo(session_id, base_url, model, method, params):
-    url = base_url
-    headers = {
-        'Content-Type': 'application/json',
-        'Cookie': f'session_id={session_id}'
-    }
+class OdooRPCError(Exception):
+    """Error answer of an Odoo JSON-RPC call, raised by call_odoo_stream"""
+
+    def __init__(self, error):
+        message = error
+        if isinstance(error, dict):
+            message = (error.get('data') or {}).get('message') or error.get('message')
+        super().__init__(message)
+        self.error = error
 
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "call",
+
+def _call_kw_payload(model, method, params):
+    return {
+        **_RPC_TEMPLATE,
         "params": {
             "model": model,
             "method": method,
@@ -98,16 +303,82 @@ def call_odoo(session_id, base_url, model, method, params):
         }
     }
 
+
+def call_odoo(session_id, base_url, model, method, params, stream=False, deadline=None):
+    if stream:
+        return call_odoo_stream(session_id, base_url, model, method, params, deadline)
+
+    url = base_url
+    headers = {'Cookie': f'session_id={session_id}'}
+    payload = _call_kw_payload(model, method, params)
+
     try:
-        response = requests.post(
-            f"{url}/web/dataset/call_kw", json=payload, headers=headers, timeout=10)
-        response.raise_for_status()
-        result = response.json()
+        result = _handle(_send(
+            url, _SESSION.post, f"{url}/web/dataset/call_kw", deadline,
+            data=_dumps(payload), headers=headers))
 
         if 'result' in result:
             return result['result']
+        elif isinstance(result.get('error'), str):
+            # A 4xx answer, already turned into an error dict by _handle
+            return result
         else:
             return {"error": "Failed to fetch data"}
 
+    except BulkheadFullError:
+        return {"error": "bulkhead_full"}
     except requests.RequestException as e:
         return {"error": f"Network error: {str(e)}"}
+    except ValueError as e:
+        return {"error": f"Invalid JSON response: {str(e)}"}
+
+
+def call_odoo_stream(session_id, base_url, model, method, params, deadline=None):
+    """Yield the items of a list-returning call_kw result while the body is still arriving.
+
+    Meant for bulk reads that would not fit comfortably in memory twice; the
+    body is parsed incrementally with ``ijson`` when it is installed and
+    buffered otherwise. Unlike call_odoo, failures are raised: network errors
+    as ``requests.RequestException`` and Odoo errors as ``OdooRPCError``.
+    Exhaust or close the generator to hand the connection back to the pool.
+    """
+    response = _send(
+        base_url, _SESSION.post, f"{base_url}/web/dataset/call_kw", deadline,
+        data=_dumps(_call_kw_payload(model, method, params)),
+        headers={'Cookie': f'session_id={session_id}'}, stream=True)
+
+    with response:
+        response.raise_for_status()
+        if ijson is None:
+            result = _loads(response.content)
+            if 'error' in result:
+                raise OdooRPCError(result['error'])
+            yield from result.get('result') or ()
+            return
+
+        # Let urllib3 undo gzip/deflate before ijson reads the raw stream
+        response.raw.decode_content = True
+        yield from _iter_result_items(response.raw)
+
+
+def _iter_result_items(raw):
+    # Build each element of "result" (or the "error" object) from the ijson
+    # event stream, so only one record is held in memory at a time.
+    builder = prefix_built = None
+    for prefix, event, value in ijson.parse(raw, use_float=True):
+        if builder is None:
+            if prefix not in ('result.item', 'error') or event in ('end_map', 'end_array'):
+                continue
+            builder, prefix_built = ijson.ObjectBuilder(), prefix
+            builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                continue
+        else:
+            builder.event(event, value)
+            if prefix != prefix_built or event not in ('end_map', 'end_array'):
+                continue
+
+        if prefix_built == 'error':
+            raise OdooRPCError(builder.value)
+        yield builder.value
+        builder = None
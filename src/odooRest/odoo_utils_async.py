@@ -0,0 +1,168 @@
+# odoo_api/odoo_utils_async.py
+
+import asyncio
+import contextlib
+
+import aiohttp
+
+from .odoo_utils import _RPC_TEMPLATE, _call_kw_payload
+from .reliability import BULKHEAD_CAPACITY, BULKHEAD_TIMEOUT, BulkheadFullError
+
+_TIMEOUT = aiohttp.ClientTimeout(total=10)
+# A ClientSession only works on the event loop that created it, and
+# asyncio.run() or async_to_sync() start a new loop per call, so keep one
+# session per running loop. A session references its loop, so entries are
+# evicted explicitly once their loop has closed.
+_SESSIONS = {}
+# Per event loop as well: an asyncio.Semaphore binds to the first loop that waits on it
+_BULKHEADS = {}
+
+
+def _evict_closed_loops():
+    for loop in [loop for loop in _BULKHEADS if loop.is_closed()]:
+        del _BULKHEADS[loop]
+    for loop in [loop for loop in _SESSIONS if loop.is_closed()]:
+        # Nothing can be awaited on a closed loop; closing the connector
+        # synchronously drops its transports and marks the session closed.
+        session = _SESSIONS.pop(loop)
+        session.connector._close()
+
+
+def get_client_session():
+    # One pooled session per event loop; a dummy cookie jar keeps the session
+    # cookies of different users from leaking into each other's requests.
+    loop = asyncio.get_running_loop()
+    _evict_closed_loops()
+    session = _SESSIONS.get(loop)
+    if session is None or session.closed:
+        session = _SESSIONS[loop] = aiohttp.ClientSession(
+            timeout=_TIMEOUT,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            connector=aiohttp.TCPConnector(limit=128),
+        )
+    return session
+
+
+async def close_client_session():
+    session = _SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def _get_bulkhead(base_url):
+    loop = asyncio.get_running_loop()
+    _evict_closed_loops()
+    bulkheads = _BULKHEADS.setdefault(loop, {})
+    bulkhead = bulkheads.get(base_url)
+    if bulkhead is None:
+        bulkhead = bulkheads[base_url] = asyncio.Semaphore(BULKHEAD_CAPACITY)
+    return bulkhead
+
+
+@contextlib.asynccontextmanager
+async def _bulkhead_slot(base_url):
+    bulkhead = _get_bulkhead(base_url)
+    try:
+        await asyncio.wait_for(bulkhead.acquire(), BULKHEAD_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise BulkheadFullError(f"Too many requests in flight to Odoo server {base_url}")
+    try:
+        yield
+    finally:
+        bulkhead.release()
+
+
+async def authenticate_async(odoo_url, odoo_db, username, password):
+    url = f"{odoo_url}/web/session/authenticate"
+
+    auth_data = {
+        **_RPC_TEMPLATE,
+        "params": {
+            "db": odoo_db,
+            "login": username,
+            "password": password,
+        },
+    }
+
+    try:
+        async with get_client_session().post(url, json=auth_data) as response:
+            response.raise_for_status()
+            result = await response.json(content_type=None)
+
+            if result.get("result"):
+                morsel = response.cookies.get('session_id')
+                if morsel is None:
+                    return {"error": "No session ID found in the response cookies."}
+
+                return {
+                    "uid": result["result"].get("uid"),
+                    "session_id": morsel.value,
+                    "cookies": {key: m.value for key, m in response.cookies.items()}
+                }
+            else:
+                return {"error": "Authentication failed."}
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return {"error": f"Network error: {str(e)}"}
+    except ValueError as e:
+        return {"error": f"Invalid JSON response: {str(e)}"}
+
+
+async def call_odoo_async(session_id, base_url, model, method, params):
+    headers = {
+        'Content-Type': 'application/json',
+        'Cookie': f'session_id={session_id}'
+    }
+
+    payload = _call_kw_payload(model, method, params)
+
+    try:
+        async with _bulkhead_slot(base_url), get_client_session().post(
+                f"{base_url}/web/dataset/call_kw", json=payload, headers=headers) as response:
+            response.raise_for_status()
+            result = await response.json(content_type=None)
+
+            if 'result' in result:
+                return result['result']
+            else:
+                return {"error": "Failed to fetch data"}
+
+    except BulkheadFullError:
+        return {"error": "bulkhead_full"}
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return {"error": f"Network error: {str(e)}"}
+    except ValueError as e:
+        return {"error": f"Invalid JSON response: {str(e)}"}
+
+
+async def odoo_request_async(endpoint, base_url, method='GET', data=None, session_id=None):
+    headers = {'Content-Type': 'application/json'}
+    if session_id:
+        headers['Cookie'] = f'session_id={session_id}'
+    url = f"{base_url}/api/{endpoint}"
+
+    if method == 'GET':
+        kwargs = {'params': data}
+    elif method in ('POST', 'PUT'):
+        kwargs = {'json': data}
+    elif method == 'DELETE':
+        kwargs = {}
+    else:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
+    async with _bulkhead_slot(base_url), \
+            get_client_session().request(method, url, headers=headers, **kwargs) as response:
+        response.raise_for_status()
+        return await response.json(content_type=None)
+
+
+async def gather_call_odoo(session_id, base_url, calls, concurrency=10):
+    """Run several ``(model, method, params)`` calls concurrently; results keep the input order"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(model, method, params):
+        # Cap in-flight RPCs so a large fan-out does not swamp the Odoo workers
+        async with semaphore:
+            return await call_odoo_async(session_id, base_url, model, method, params)
+
+    return await asyncio.gather(*(bounded(*call) for call in calls))
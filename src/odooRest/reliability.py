@@ -0,0 +1,132 @@
+# odoo_api/reliability.py
+
+import os
+import threading
+import time
+
+import requests
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of sending a request to an Odoo server whose circuit is open"""
+
+
+class BulkheadFullError(requests.ConnectionError):
+    """Raised when too many requests to the same Odoo server are already in flight"""
+
+
+# Max concurrent requests per Odoo server, and how long a request may wait for a slot
+BULKHEAD_CAPACITY = int(os.environ.get('ODOO_BULKHEAD', 20))
+BULKHEAD_TIMEOUT = 5
+
+# Connect timeout of calls bounded by a deadline; the rest of the budget goes to reading
+CONNECT_TIMEOUT = 3
+
+# Statuses that say the server itself is down or overloaded. A 500 is Odoo
+# reporting a deterministic exception in one route (often bad input), which
+# must not cut every other caller off from a healthy server.
+UNAVAILABLE_STATUSES = frozenset((502, 503, 504))
+
+
+class CircuitBreaker:
+    """Fails fast once an Odoo server has failed ``failure_threshold`` times in a row.
+
+    After ``recovery_timeout`` seconds a single probe request is let through;
+    its success closes the circuit again, its failure keeps it open.
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.recovery_timeout:
+                # Half-open: let this request probe the server, keep failing the rest
+                self._opened_at = now
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+_BREAKERS = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_breaker(base_url):
+    breaker = _BREAKERS.get(base_url)
+    if breaker is None:
+        with _REGISTRY_LOCK:
+            breaker = _BREAKERS.setdefault(base_url, CircuitBreaker())
+    return breaker
+
+
+_BULKHEADS = {}
+
+
+def get_bulkhead(base_url):
+    # One slot pool per server, so a slow Odoo cannot take every pooled
+    # connection and worker thread away from requests to the others.
+    bulkhead = _BULKHEADS.get(base_url)
+    if bulkhead is None:
+        with _REGISTRY_LOCK:
+            bulkhead = _BULKHEADS.setdefault(base_url, threading.BoundedSemaphore(BULKHEAD_CAPACITY))
+    return bulkhead
+
+
+def guarded_send(base_url, send, url, deadline=None, **kwargs):
+    """Send a request through the circuit breaker and bulkhead of ``base_url``.
+
+    With a ``deadline`` (an absolute time.monotonic() value) both the wait for a
+    bulkhead slot and the request timeout are bounded by it, and failures once it
+    has run out are the caller's, not the server's.
+    """
+    breaker = get_breaker(base_url)
+    if not breaker.allow():
+        raise CircuitOpenError(f"Odoo server {base_url} is unavailable, not sending request")
+
+    bulkhead = get_bulkhead(base_url)
+    wait = BULKHEAD_TIMEOUT
+    if deadline is not None:
+        wait = max(0, min(wait, deadline - time.monotonic()))
+    if not bulkhead.acquire(timeout=wait):
+        if wait < BULKHEAD_TIMEOUT:
+            raise requests.Timeout(f"Deadline exceeded waiting for a slot on Odoo server {base_url}")
+        raise BulkheadFullError(f"Too many requests in flight to Odoo server {base_url}")
+    try:
+        if deadline is not None:
+            # Measured after the slot wait, so the socket only gets what is left
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise requests.Timeout("Deadline exceeded before calling Odoo")
+            kwargs['timeout'] = (min(CONNECT_TIMEOUT, remaining), remaining)
+        response = send(url, **kwargs)
+    except (requests.ConnectionError, requests.Timeout):
+        if deadline is None or time.monotonic() < deadline:
+            breaker.record_failure()
+        raise
+    finally:
+        bulkhead.release()
+
+    # 4xx and plain 500 answers (bad credentials, missing records, ...) still prove the server is up
+    if response.status_code in UNAVAILABLE_STATUSES:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response